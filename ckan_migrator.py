@@ -9,33 +9,353 @@ Uses persistent sessions and disables SSL verification for compatibility.
 """
 
 import os
+import atexit
 import json
-import re
+import shutil
+import string
 import time
 import datetime
 import requests
+import urllib3
 import logging
+from logging.handlers import QueueHandler, QueueListener
 import sys
 import argparse
+import threading
+import queue
+import itertools
+import functools
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from urllib.parse import urljoin
+from requests.adapters import HTTPAdapter
 from urllib3.exceptions import InsecureRequestWarning
+from urllib3.fields import RequestField
+from urllib3.filepost import choose_boundary, encode_multipart_formdata
+from urllib3.util.retry import Retry
+
+# orjson is optional; it parses API responses and writes metadata files considerably faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Disable SSL warnings when verification is disabled
 requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
 
-# Set up logging
+# Set up logging; records are handed to a listener thread so that writing
+# to the log file and console never blocks the migration threads
+_log_queue = queue.Queue()
+_log_handlers = [
+    logging.FileHandler("migration.log"),
+    logging.StreamHandler(sys.stdout)
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+
+_log_listener = QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+_queue_handler = QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("migration.log"),
-        logging.StreamHandler(sys.stdout)
-    ]
+    handlers=[_queue_handler]
 )
+logging.getLogger("urllib3").setLevel(logging.WARNING)
 logger = logging.getLogger("ckan_migrator")
 
+
+class _HeldThreadLogs(logging.Filter):
+    """Logger filter that holds back one thread's records until released, e.g. while a prompt is shown"""
+    
+    def __init__(self, thread_name):
+        super().__init__()
+        self.thread_name = thread_name
+        self._held = []
+        self._holding = True
+        self._lock = threading.Lock()
+    
+    def filter(self, record):
+        if record.threadName != self.thread_name:
+            return True
+        
+        with self._lock:
+            if self._holding:
+                self._held.append(record)
+                return False
+        return True
+    
+    def release(self):
+        """Log the held records and let the thread's later records through"""
+        with self._lock:
+            self._holding = False
+            held, self._held = self._held, []
+        
+        for record in held:
+            logger.handle(record)
+
+
+# Organization fields that shouldn't be included in organization_create requests
+_ORG_DROP = frozenset([
+    "id", "created", "is_organization", "revision_id", "revision_timestamp",
+    "packages", "display_name", "package_count", "users", "groups",
+    "followers_count", "state", "num_followers"
+])
+
+# Dataset fields that shouldn't be included in package_create requests
+_PACKAGE_DROP = frozenset([
+    "id", "resources", "metadata_created", "metadata_modified", "revision_id",
+    "revision_timestamp", "creator_user_id", "private"
+])
+
+# Resource fields that shouldn't be included in resource_create requests
+_RESOURCE_DROP = frozenset([
+    "id", "created", "last_modified", "revision_id", "resource_type",
+    "position", "cache_url", "cache_last_updated", "webstore_url",
+    "webstore_last_updated", "datastore_active"
+])
+
+
+def _loads(data):
+    """Parse JSON from bytes or str"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj, pretty=False):
+    """Serialize an object to JSON bytes, compact unless pretty output is requested"""
+    if pretty:
+        return json.dumps(obj, indent=2).encode()
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def _json_body(obj):
+    """Keyword arguments that POST an object as a JSON body serialized with _dumps"""
+    return {"data": _dumps(obj if obj is not None else {}),
+            "headers": {"Content-Type": "application/json"}}
+
+
+def _solr_quote(value):
+    """Quote a value for use as a term in a Solr query"""
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def _map_bounded(executor, fn, items, limit):
+    """Like executor.map, but with at most limit calls submitted at once; returns a list in input order
+    
+    Keeps one caller from occupying every thread of a shared executor.
+    """
+    results = [None] * len(items)
+    pending = {}
+    
+    for index, item in enumerate(items):
+        if len(pending) >= limit:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[pending.pop(future)] = future.result()
+        pending[executor.submit(fn, item)] = index
+    
+    for future, index in pending.items():
+        results[index] = future.result()
+    
+    return results
+
+
+def _fadvise(f, advice_name):
+    """Give the kernel a page cache hint for a whole open file where posix_fadvise is supported"""
+    advice = getattr(os, advice_name, None)
+    if advice is None or not hasattr(os, 'posix_fadvise'):
+        return
+    
+    try:
+        os.posix_fadvise(f.fileno(), 0, 0, advice)
+    except OSError:
+        pass
+
+
+class _MultipartFile:
+    """Seekable multipart/form-data body that streams one upload file from disk
+    
+    requests' files= reads the whole file into memory before sending it. This body
+    reads the file in chunks instead, and since it can seek back to the start the
+    session can still retry the POST.
+    """
+    
+    def __init__(self, fields, name, filename, fileobj):
+        boundary = choose_boundary()
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        
+        # Encode the form fields and file part headers with an empty file, then
+        # split off the closing boundary so the file is streamed in between
+        file_field = RequestField.from_tuples(name, (filename, b""))
+        encoded, _ = encode_multipart_formdata(list(fields.items()) + [file_field], boundary)
+        self._tail = f"\r\n--{boundary}--\r\n".encode("latin-1")
+        self._head = encoded[:-len(self._tail)]
+        
+        self._file = fileobj
+        self._file_start = len(self._head)
+        self._tail_start = self._file_start + os.fstat(fileobj.fileno()).st_size
+        self._length = self._tail_start + len(self._tail)
+        self._pos = 0
+        self.seek(0)
+    
+    def __len__(self):
+        return self._length
+    
+    def __iter__(self):
+        while True:
+            chunk = self.read(1024 * 1024)
+            if not chunk:
+                return
+            yield chunk
+    
+    def tell(self):
+        return self._pos
+    
+    def seek(self, pos, whence=os.SEEK_SET):
+        if whence != os.SEEK_SET:
+            raise OSError("only absolute seeks are supported")
+        self._pos = pos
+        self._file.seek(min(max(pos - self._file_start, 0), self._tail_start - self._file_start))
+        return pos
+    
+    def read(self, size=-1):
+        if size is None or size < 0:
+            size = self._length - self._pos
+        
+        chunks = []
+        while size > 0 and self._pos < self._length:
+            if self._pos < self._file_start:
+                chunk = self._head[self._pos:self._pos + size]
+            elif self._pos < self._tail_start:
+                chunk = self._file.read(min(size, self._tail_start - self._pos))
+                if not chunk:
+                    raise OSError("upload file is shorter than when the upload started")
+            else:
+                offset = self._pos - self._tail_start
+                chunk = self._tail[offset:offset + size]
+            
+            self._pos += len(chunk)
+            size -= len(chunk)
+            chunks.append(chunk)
+        
+        return b"".join(chunks)
+
+
+class _SanitizeTable(dict):
+    """str.translate table mapping every character outside [a-z0-9_-] to '_'"""
+    
+    _ALLOWED = frozenset(string.ascii_lowercase + string.digits + '_-')
+    
+    def __init__(self):
+        # Precompute ASCII; other code points are filled in on first use
+        super().__init__((c, c if chr(c) in self._ALLOWED else ord('_')) for c in range(128))
+    
+    def __missing__(self, codepoint):
+        self[codepoint] = ord('_')
+        return ord('_')
+
+
+_SANITIZE_TABLE = _SanitizeTable()
+
+
+class RateLimiter:
+    """Thread-safe token bucket that limits how many items are started per second
+    
+    The rate adapts to the servers: it is halved whenever a response signals
+    overload (HTTP 429/503) and doubled back toward max_rate after a run of
+    successful responses. A max_rate of 0 disables limiting.
+    """
+    
+    def __init__(self, max_rate, burst=1, recovery_after=50):
+        self.max_rate = max_rate
+        self.rate = max_rate
+        self.min_rate = max_rate / 64
+        self.burst = max(1, burst)
+        self.recovery_after = recovery_after
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._successes = 0
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Wait until another item may be started"""
+        if self.max_rate <= 0:
+            return
+        
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            
+            # Take a token now, waiting outside the lock for it to be earned if the bucket is empty
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        
+        if wait:
+            time.sleep(wait)
+    
+    def backoff(self):
+        """Halve the rate after the server signalled overload"""
+        if self.max_rate <= 0:
+            return
+        
+        with self._lock:
+            self._successes = 0
+            if self.rate > self.min_rate:
+                self.rate = max(self.min_rate, self.rate / 2)
+                logger.warning(f"Server is overloaded, slowing down to {self.rate:.2f} items/second")
+    
+    def record_success(self):
+        """Double the rate back toward max_rate after sustained success"""
+        if self.max_rate <= 0 or self.rate >= self.max_rate:
+            return
+        
+        with self._lock:
+            self._successes += 1
+            if self._successes >= self.recovery_after:
+                self._successes = 0
+                self.rate = min(self.max_rate, self.rate * 2)
+
+
+class ProgressReporter:
+    """Thread-safe counter of finished items that logs progress at most once per interval
+    
+    Replaces a log line per item, so large runs stay readable and the log
+    is not flooded from every worker thread.
+    """
+    
+    def __init__(self, label, total, interval=10.0):
+        self.label = label
+        self.total = total
+        self.interval = interval
+        self.done = 0
+        self._started = time.monotonic()
+        self._last_report = self._started
+        self._lock = threading.Lock()
+    
+    def update(self, count=1):
+        """Record finished items, logging progress if the interval has passed or all are done"""
+        with self._lock:
+            self.done += count
+            now = time.monotonic()
+            if self.done < self.total and now - self._last_report < self.interval:
+                return
+            self._last_report = now
+            done = self.done
+            rate = done / max(now - self._started, 1e-9)
+        
+        logger.info("%s: %d/%d processed (%.1f/s)", self.label, done, self.total, rate)
+
+
 class CkanMigrator:
-    def __init__(self, source_url, source_api_key, target_url, target_api_key):
+    def __init__(self, source_url, source_api_key, target_url, target_api_key, max_workers=8,
+                 pretty_json=False, force_refresh=False, rate_limit=10.0, force=False):
         """Initialize the CKAN migrator with source and target information"""
         self.source_url = source_url.rstrip('/')
         self.source_api_key = source_api_key
@@ -45,29 +365,90 @@ class CkanMigrator:
         self.org_dir = os.path.join(self.download_dir, "organizations")
         self.datasets_dir = os.path.join(self.download_dir, "datasets")
         
-        # Create persistent session with SSL verification disabled
-        self.session = requests.Session()
-        self.session.verify = False
+        # Number of organizations/datasets processed concurrently
+        self.max_workers = max_workers
         
-        # Set default headers
-        self.session.headers.update({
-            'User-Agent': 'CKAN-Migration-Tool/1.0'
-        })
+        # Limits how many organizations/datasets are started per second; it slows
+        # down on its own when either server answers 429/503
+        self.rate_limiter = RateLimiter(rate_limit, burst=max_workers)
+        
+        # Write indented metadata files (for debugging) instead of compact ones
+        self.pretty_json = pretty_json
+        
+        # Download metadata and resource files again even if an earlier run saved them
+        self.force_refresh = force_refresh
+        
+        # Migrate datasets even if the target already has them with all their resources
+        self.force = force
+        self.skipped_datasets = []
+        
+        # Number of resource files downloaded/uploaded concurrently for each dataset;
+        # uploads are kept low to stay within what CKAN tolerates
+        self.resource_download_workers = 8
+        self.resource_upload_workers = 4
+        
+        # Number of downloaded datasets that may wait for upload while the next ones download
+        self.pipeline_queue_size = 8
+        
+        # Number of datasets whose metadata is fetched with a single package_search call
+        self.package_batch_size = 100
+        
+        # Create one persistent session per endpoint with SSL verification disabled,
+        # with enough pooled connections per host for every concurrent transfer to keep its own
+        self.source_session = self._create_session(
+            self.source_api_key, self.max_workers * self.resource_download_workers)
+        self.target_session = self._create_session(
+            self.target_api_key, self.max_workers * (1 + self.resource_upload_workers))
+        
+        # Long-lived thread pools for resource transfers, shared by all datasets
+        # instead of starting new threads for every dataset; each dataset still
+        # submits at most its per-dataset number of transfers at a time
+        self._download_executor = ThreadPoolExecutor(
+            max_workers=self.max_workers * self.resource_download_workers, thread_name_prefix="download")
+        self._upload_executor = ThreadPoolExecutor(
+            max_workers=self.max_workers * self.resource_upload_workers, thread_name_prefix="upload")
         
         # Create download directory if it doesn't exist
         for directory in [self.download_dir, self.org_dir, self.datasets_dir]:
-            if not os.path.exists(directory):
-                os.makedirs(directory)
+            os.makedirs(directory, exist_ok=True)
         
         # Dictionary to map source organization IDs to target organization IDs
         self.org_id_mapping = {}
         
+        # Guards the mapping and its file while organizations are migrated concurrently
+        self._mapping_lock = threading.Lock()
+        
+        # Notified when a mapping is recorded or the organization phase ends, so datasets
+        # migrated alongside the organizations can wait for their owner org
+        self._mapping_changed = threading.Condition(self._mapping_lock)
+        self._orgs_done = True
+        
+        # Mapping entries not yet written to disk, saved every mapping_save_interval entries
+        self._mapping_unsaved = 0
+        self.mapping_save_interval = 50
+        
+        # Successful source organization_show responses keyed by org ID and name
+        self._org_show_cache = {}
+        
+        # Source listings, which do not change during a run: the full organization
+        # listing (None until loaded) and get_dataset_list results keyed by arguments
+        self._source_orgs_cache = None
+        self._dataset_list_cache = {}
+        
+        # Name -> ID indexes of existing target organizations and datasets,
+        # loaded once per run by _prime_target_indexes (None until loaded)
+        self._target_org_names = None
+        self._target_pkg_names = None
+        
+        # Name -> resource count of target datasets, loaded with the dataset index
+        self._target_pkg_resources = None
+        
         # Read the mapping file if it exists (for resuming migration)
         mapping_file = os.path.join(self.download_dir, "org_mapping.json")
         if os.path.exists(mapping_file):
             try:
-                with open(mapping_file, 'r') as f:
-                    self.org_id_mapping = json.load(f)
+                with open(mapping_file, 'rb') as f:
+                    self.org_id_mapping = _loads(f.read())
                 logger.info(f"Loaded organization mapping with {len(self.org_id_mapping)} entries")
             except Exception as e:
                 logger.error(f"Error loading organization mapping: {e}")
@@ -77,19 +458,90 @@ class CkanMigrator:
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit - close session"""
-        self.session.close()
+        """Context manager exit - close sessions"""
+        self.close()
+
+    def _create_session(self, api_key, pool_size):
+        """Create a persistent session with a warm connection pool for one CKAN endpoint"""
+        session = requests.Session()
+        session.verify = False
+        
+        # Set default headers once so every request reuses them
+        session.headers.update({
+            'User-Agent': 'CKAN-Migration-Tool/1.0',
+            'Authorization': api_key
+        })
+        
+        # Keep connections alive across the many small API calls and retry
+        # connection errors and transient HTTP errors with exponential backoff
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(["GET", "POST"]),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=max(32, pool_size), max_retries=retry)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        
+        # Let every response, including urllib3's retried attempts, adjust the rate limit
+        session.hooks['response'].append(self._track_response)
+        
+        return session
+
+    def _track_response(self, response, *args, **kwargs):
+        """Session response hook that slows the rate limiter down when a server is overloaded"""
+        retries = getattr(response.raw, 'retries', None)
+        statuses = [attempt.status for attempt in getattr(retries, 'history', ())]
+        statuses.append(response.status_code)
+        
+        if 429 in statuses or 503 in statuses:
+            self.rate_limiter.backoff()
+        elif response.status_code < 400:
+            self.rate_limiter.record_success()
+
+    def close(self):
+        """Shut down the resource transfer pools and close the source and target sessions"""
+        self._download_executor.shutdown()
+        self._upload_executor.shutdown()
+        self.source_session.close()
+        self.target_session.close()
 
     def save_org_mapping(self):
         """Save the organization mapping to a file"""
         mapping_file = os.path.join(self.download_dir, "org_mapping.json")
+        tmp_file = mapping_file + ".tmp"
         try:
-            with open(mapping_file, 'w') as f:
-                json.dump(self.org_id_mapping, f, indent=2)
+            with self._mapping_lock:
+                # Write to a temporary file and swap it in so the mapping is never left half-written
+                with open(tmp_file, 'wb') as f:
+                    f.write(_dumps(self.org_id_mapping, self.pretty_json))
+                os.replace(tmp_file, mapping_file)
+                self._mapping_unsaved = 0
             logger.info(f"Saved organization mapping with {len(self.org_id_mapping)} entries")
         except Exception as e:
             logger.error(f"Error saving organization mapping: {e}")
 
+    def _record_org_mapping(self, org_id, target_org_id):
+        """Store an organization ID mapping, saving the mapping file every few entries"""
+        with self._mapping_lock:
+            self.org_id_mapping[org_id] = target_org_id
+            self._mapping_unsaved += 1
+            save_needed = self._mapping_unsaved >= self.mapping_save_interval
+            self._mapping_changed.notify_all()
+        
+        if save_needed:
+            self.save_org_mapping()
+
+    def _wait_for_org_mapping(self, org_id):
+        """Get the target ID of a source organization, waiting while the organization phase may still map it"""
+        with self._mapping_changed:
+            while org_id not in self.org_id_mapping and not self._orgs_done:
+                self._mapping_changed.wait()
+            return self.org_id_mapping.get(org_id)
+    
     def prepare_target_database(self):
         """Check target CKAN instance"""
         try:
@@ -97,15 +549,14 @@ class CkanMigrator:
             
             # Check status of target CKAN
             check_url = urljoin(self.target_url, "api/3/action/status_show")
-            headers = {"Authorization": self.target_api_key}
-            response = self.session.get(check_url, headers=headers)
+            response = self.target_session.get(check_url)
             
             if response.status_code == 200:
                 logger.info("Target CKAN instance is accessible.")
                 
                 # Check if the target CKAN is version 2.11+
                 try:
-                    response_json = response.json()
+                    response_json = _loads(response.content)
                     if 'result' in response_json and 'ckan_version' in response_json['result']:
                         ckan_version = response_json['result']['ckan_version']
                         logger.info(f"Target CKAN version: {ckan_version}")
@@ -124,164 +575,185 @@ class CkanMigrator:
             logger.error(f"Error checking target database: {e}")
             return False
     
-    def source_request(self, url, method="GET", params=None, data=None, files=None):
-        """Make a request to the source CKAN using persistent session"""
-        if params is None:
-            params = {}
-        
-        headers = {"Authorization": self.source_api_key}
-        
-        max_retries = 3
-        retry_delay = 5  # seconds
-        
-        for attempt in range(max_retries):
-            try:
-                if method == "GET":
-                    response = self.session.get(url, headers=headers, params=params)
-                elif method == "POST":
-                    response = self.session.post(url, headers=headers, json=data, files=files)
-                
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    error_msg = f"HTTP {response.status_code}"
-                    try:
-                        error_data = response.json()
-                        if 'error' in error_data:
-                            error_msg = f"{error_msg}: {error_data['error']}"
-                    except:
-                        error_msg = f"{error_msg}: {response.text[:100]}"
-                    
-                    logger.error(f"Source API error: {error_msg}")
-                    
-                    if attempt < max_retries - 1:
-                        logger.info(f"Retrying in {retry_delay} seconds...")
-                        time.sleep(retry_delay)
-                    else:
-                        return {"success": False, "error": error_msg}
-                    
-            except Exception as e:
-                logger.error(f"Request failed (attempt {attempt+1}/{max_retries}): {e}")
-                if attempt < max_retries - 1:
-                    logger.info(f"Retrying in {retry_delay} seconds...")
-                    time.sleep(retry_delay)
+    def _request(self, session, url, method="GET", params=None, data=None, files=None, api_name="API"):
+        """Make a request with one of the persistent sessions; transient errors are retried by the session"""
+        try:
+            if method == "GET":
+                response = session.get(url, params=params)
+            elif method == "POST":
+                if files:
+                    response = session.post(url, data=data, files=files)
                 else:
-                    return {"success": False, "error": str(e)}
+                    response = session.post(url, **_json_body(data))
+            
+            # Decode the body once and use it for both the result and any error message;
+            # error pages that are not JSON (e.g. a proxy's 429/503 page) are not decoded
+            response_data = None
+            if response.status_code == 200 or 'json' in response.headers.get('Content-Type', ''):
+                try:
+                    response_data = _loads(response.content)
+                except ValueError:
+                    pass
+            
+            if response.status_code == 200 and response_data is not None:
+                return response_data
+            
+            error_msg = f"HTTP {response.status_code}"
+            if isinstance(response_data, dict) and 'error' in response_data:
+                error_msg = f"{error_msg}: {response_data['error']}"
+            else:
+                error_msg = f"{error_msg}: {response.text[:100]}"
+            
+            logger.error(f"{api_name} error: {error_msg}")
+            return {"success": False, "error": error_msg}
         
-        return {"success": False, "error": "Max retries exceeded"}
+        except Exception as e:
+            logger.error(f"Request failed: {e}")
+            return {"success": False, "error": str(e)}
+    
+    def source_request(self, url, method="GET", params=None, data=None, files=None):
+        """Make a request to the source CKAN using persistent session"""
+        return self._request(self.source_session, url, method, params, data, files, api_name="Source API")
     
     def target_request(self, url, method="GET", params=None, data=None, files=None):
         """Make a request to the target CKAN using persistent session"""
-        if params is None:
-            params = {}
-        
-        headers = {"Authorization": self.target_api_key}
-        
-        max_retries = 3
-        retry_delay = 5  # seconds
-        
-        for attempt in range(max_retries):
-            try:
-                if method == "GET":
-                    response = self.session.get(url, headers=headers, params=params)
-                elif method == "POST":
-                    response = self.session.post(url, headers=headers, json=data, files=files)
-                
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    error_msg = f"HTTP {response.status_code}"
-                    try:
-                        error_data = response.json()
-                        if 'error' in error_data:
-                            error_msg = f"{error_msg}: {error_data['error']}"
-                    except:
-                        error_msg = f"{error_msg}: {response.text[:100]}"
-                    
-                    logger.error(f"Target API error: {error_msg}")
-                    
-                    if attempt < max_retries - 1:
-                        logger.info(f"Retrying in {retry_delay} seconds...")
-                        time.sleep(retry_delay)
-                    else:
-                        return {"success": False, "error": error_msg}
-                    
-            except Exception as e:
-                logger.error(f"Request failed (attempt {attempt+1}/{max_retries}): {e}")
-                if attempt < max_retries - 1:
-                    logger.info(f"Retrying in {retry_delay} seconds...")
-                    time.sleep(retry_delay)
-                else:
-                    return {"success": False, "error": str(e)}
-        
-        return {"success": False, "error": "Max retries exceeded"}
+        return self._request(self.target_session, url, method, params, data, files, api_name="Target API")
     
     def sanitize_name(self, name):
         """Sanitize a name to ensure it's valid in CKAN 2.11"""
         if not name:
             return name
             
-        # Remove invalid characters
-        sanitized = re.sub(r'[^a-z0-9_\-]', '_', name.lower())
-        
-        # Make sure it's not too long
-        if len(sanitized) > 100:
-            sanitized = sanitized[:100]
-            
-        return sanitized
+        # Replace invalid characters and make sure it's not too long
+        return name.lower().translate(_SANITIZE_TABLE)[:100]
+    
+    def _prime_target_indexes(self, load_orgs=True, load_datasets=True):
+        """Load the names and IDs of existing target organizations and datasets in a few listing calls"""
+        if load_orgs:
+            organizations = self._get_all_organizations(self.target_url, self.target_request)
+            if organizations is not None:
+                self._target_org_names = {org.get("name"): org.get("id") for org in organizations}
+                logger.info(f"Found {len(self._target_org_names)} existing organizations on target")
+        
+        if load_datasets:
+            # Only the fields kept in the indexes, not every dataset's full metadata
+            params = {"q": "*:*", "include_drafts": True, "fl": "id,name,num_resources"}
+            datasets = self._search_datasets(self.target_url, self.target_request, params)
+            if datasets is not None:
+                self._target_pkg_names = {dataset.get("name"): dataset.get("id") for dataset in datasets}
+                self._target_pkg_resources = {
+                    dataset.get("name"): dataset.get("num_resources", len(dataset.get("resources", [])))
+                    for dataset in datasets
+                }
+                logger.info(f"Found {len(self._target_pkg_names)} existing datasets on target")
     
     def get_organization_list(self, specific_orgs=None):
         """Get list of organizations from source CKAN"""
-        url = urljoin(self.source_url, "api/3/action/organization_list")
-        
         logger.info("Retrieving list of organizations...")
+        
+        if specific_orgs:
+            # Fetch name and ID of every org in one listing and match locally
+            if self._source_orgs_cache is None:
+                self._source_orgs_cache = self._get_all_organizations(self.source_url, self.source_request)
+            organizations = self._source_orgs_cache
+            
+            if organizations is None:
+                return []
+            
+            logger.info(f"Found {len(organizations)} organizations in total")
+            
+            # Filter organizations by name or ID
+            wanted = set(specific_orgs)
+            filtered_orgs = [org.get("name") for org in organizations
+                             if org.get("id") in wanted or org.get("name") in wanted]
+            
+            logger.info(f"Filtered to {len(filtered_orgs)} specified organizations")
+            return filtered_orgs
+        
+        url = urljoin(self.source_url, "api/3/action/organization_list")
         response = self.source_request(url)
         
         if response.get("success", False):
             all_org_ids = response.get("result", [])
             logger.info(f"Found {len(all_org_ids)} organizations in total")
-            
-            if specific_orgs:
-                # Filter organizations by name or ID
-                filtered_orgs = []
-                
-                # First try to match by direct ID
-                for org_id in specific_orgs:
-                    if org_id in all_org_ids:
-                        filtered_orgs.append(org_id)
-                
-                # If we haven't matched all orgs, try matching by name
-                if len(filtered_orgs) < len(specific_orgs):
-                    # Get details of all orgs to match by name
-                    for org_id in all_org_ids:
-                        if org_id in filtered_orgs:
-                            continue
-                            
-                        url = urljoin(self.source_url, "api/3/action/organization_show")
-                        params = {"id": org_id}
-                        org_response = self.source_request(url, params=params)
-                        
-                        if org_response.get("success", False):
-                            org_name = org_response.get("result", {}).get("name")
-                            if org_name in specific_orgs:
-                                filtered_orgs.append(org_id)
-                
-                logger.info(f"Filtered to {len(filtered_orgs)} specified organizations")
-                return filtered_orgs
-            else:
-                return all_org_ids
+            return all_org_ids
         else:
             logger.error(f"Failed to get organization list: {response.get('error', {})}")
             return []
     
-    def download_organization(self, org_id):
-        """Download a single organization metadata"""
-        logger.info(f"Downloading organization: {org_id}")
+    def _get_all_organizations(self, base_url, request):
+        """Get name and ID of every organization on a CKAN instance using paged organization_list calls"""
+        url = urljoin(base_url, "api/3/action/organization_list")
+        organizations = []
+        
+        # CKAN caps all_fields listings per call, so page until an empty result
+        while True:
+            params = {
+                "all_fields": True,
+                "include_dataset_count": False,
+                "offset": len(organizations)
+            }
+            response = request(url, params=params)
+            
+            if not response.get("success", False):
+                logger.error(f"Failed to get organization list: {response.get('error', {})}")
+                return None
+            
+            page = response.get("result", [])
+            if not page:
+                return organizations
+            
+            organizations.extend(page)
+    
+    def _show_organization(self, org_id):
+        """Get source organization metadata, reusing earlier organization_show responses"""
+        cached = self._org_show_cache.get(org_id)
+        if cached is not None:
+            return cached
+        
         url = urljoin(self.source_url, "api/3/action/organization_show")
         params = {"id": org_id, "include_datasets": False}
+        response = self.source_request(url, params=params)
+        
+        if response.get("success", False):
+            # Cache under the requested key as well as the org's ID and name
+            org_data = response.get("result", {})
+            for key in (org_id, org_data.get("id"), org_data.get("name")):
+                if key:
+                    self._org_show_cache[key] = response
+        
+        return response
+    
+    def _load_cached_metadata(self, metadata_file):
+        """Load metadata saved by an earlier run, or None if there is no usable file"""
+        if not os.path.exists(metadata_file):
+            return None
+        
+        try:
+            with open(metadata_file, 'rb') as f:
+                return _loads(f.read())
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable metadata file {metadata_file}: {e}")
+            return None
+    
+    def download_organization(self, org_id):
+        """Download a single organization metadata"""
+        org_file = os.path.join(self.org_dir, f"{org_id}.json")
+        
+        # Reuse metadata saved by an earlier run unless a refresh is forced
+        if not self.force_refresh:
+            org_data = self._load_cached_metadata(org_file)
+            if org_data is not None:
+                logger.debug("Using saved organization metadata: %s", org_id)
+                return {
+                    "metadata": org_data,
+                    "metadata_file": org_file
+                }
+        
+        logger.debug("Downloading organization: %s", org_id)
         
         # Get organization metadata with all details
-        response = self.source_request(url, params=params)
+        response = self._show_organization(org_id)
         
         if not response.get("success", False):
             logger.error(f"Failed to get organization {org_id}: {response.get('error', {})}")
@@ -290,9 +762,8 @@ class CkanMigrator:
         org_data = response.get("result", {})
         
         # Save organization metadata
-        org_file = os.path.join(self.org_dir, f"{org_id}.json")
-        with open(org_file, 'w') as f:
-            json.dump(org_data, f, indent=2)
+        with open(org_file, 'wb') as f:
+            f.write(_dumps(org_data, self.pretty_json))
         
         return {
             "metadata": org_data,
@@ -310,47 +781,40 @@ class CkanMigrator:
         
         # If the organization is already in our mapping, skip it
         if org_id in self.org_id_mapping:
-            logger.info(f"Organization {org_name} already migrated, skipping")
+            logger.debug("Organization %s already migrated, skipping", org_name)
             return True
         
-        logger.info(f"Processing organization: {org_name}")
+        logger.debug("Processing organization: %s", org_name)
         
-        # Sanitize organization data
-        sanitized_metadata = metadata.copy()
+        # Sanitize organization data, dropping fields that shouldn't be included in the creation request
+        sanitized_metadata = {key: value for key, value in metadata.items() if key not in _ORG_DROP}
         
         # Ensure name is valid
         original_name = sanitized_metadata.get('name', '')
         sanitized_name = self.sanitize_name(original_name)
         
         if original_name != sanitized_name:
-            logger.info(f"Organization name sanitized: '{original_name}' -> '{sanitized_name}'")
+            logger.debug("Organization name sanitized: '%s' -> '%s'", original_name, sanitized_name)
             sanitized_metadata['name'] = sanitized_name
         
-        # Remove fields that shouldn't be included in the creation request
-        fields_to_remove = [
-            "id", "created", "is_organization", "revision_id", "revision_timestamp", 
-            "packages", "display_name", "package_count", "users", "groups", 
-            "followers_count", "state", "num_followers"
-        ]
-        
-        for field in fields_to_remove:
-            if field in sanitized_metadata:
-                del sanitized_metadata[field]
-        
-        # Check if org exists by name
-        check_url = urljoin(self.target_url, "api/3/action/organization_show")
-        check_params = {"id": sanitized_name}
-        check_response = self.target_request(check_url, params=check_params)
+        # Check if org exists by name, using the target index when it has been loaded
+        if self._target_org_names is not None:
+            existing_org_id = self._target_org_names.get(sanitized_name)
+        else:
+            check_url = urljoin(self.target_url, "api/3/action/organization_show")
+            check_params = {"id": sanitized_name}
+            check_response = self.target_request(check_url, params=check_params)
+            
+            existing_org_id = None
+            if check_response.get("success", False):
+                existing_org_id = check_response.get("result", {}).get("id")
         
-        if check_response.get("success", False):
-            # Organization already exists, get its ID
-            existing_org = check_response.get("result", {})
-            existing_org_id = existing_org.get("id")
-            logger.info(f"Organization already exists with ID: {existing_org_id}")
+        if existing_org_id:
+            # Organization already exists
+            logger.debug("Organization already exists with ID: %s", existing_org_id)
             
             # Store ID mapping
-            self.org_id_mapping[org_id] = existing_org_id
-            self.save_org_mapping()
+            self._record_org_mapping(org_id, existing_org_id)
             return True
         
         # Create organization in target CKAN
@@ -364,44 +828,71 @@ class CkanMigrator:
         created_org = create_response.get("result", {})
         created_org_id = created_org.get("id")
         
-        logger.info(f"Created organization with ID: {created_org_id}")
+        logger.debug("Created organization with ID: %s", created_org_id)
+        
+        if self._target_org_names is not None:
+            self._target_org_names[sanitized_name] = created_org_id
         
         # Store ID mapping
-        self.org_id_mapping[org_id] = created_org_id
-        self.save_org_mapping()
+        self._record_org_mapping(org_id, created_org_id)
         return True
     
     def get_dataset_list(self, specific_datasets=None, org_id=None):
+        """Get list of datasets from source CKAN, reusing earlier results for the same arguments"""
+        key = (tuple(specific_datasets or ()), org_id)
+        cached = self._dataset_list_cache.get(key)
+        if cached is not None:
+            return list(cached)
+        
+        dataset_ids = self._list_datasets(specific_datasets, org_id)
+        
+        # Only cache successful lookups so a failed listing is retried
+        if dataset_ids:
+            self._dataset_list_cache[key] = dataset_ids
+        
+        return list(dataset_ids)
+    
+    def _list_datasets(self, specific_datasets=None, org_id=None):
         """Get list of datasets from source CKAN"""
         if specific_datasets:
-            # First try to get datasets directly by ID
+            # Look up the specified datasets by name or ID with batched package_search calls
+            datasets = self.download_packages_bulk(specific_datasets)
+            
+            if datasets is None:
+                return []
+            
+            found = {}
+            for dataset in datasets:
+                found[dataset.get("name")] = dataset.get("id")
+                found[dataset.get("id")] = dataset.get("id")
+            
             dataset_ids = []
             for dataset_id in specific_datasets:
-                url = urljoin(self.source_url, "api/3/action/package_show")
-                params = {"id": dataset_id}
-                response = self.source_request(url, params=params)
-                
-                if response.get("success", False):
-                    dataset_ids.append(dataset_id)
-                    
-            logger.info(f"Found {len(dataset_ids)} specified datasets by ID")
+                if dataset_id not in found:
+                    logger.warning(f"Dataset {dataset_id} not found on source")
+                elif found[dataset_id] not in dataset_ids:
+                    dataset_ids.append(found[dataset_id])
+            
+            logger.info(f"Found {len(dataset_ids)} specified datasets by name or ID")
             return dataset_ids
             
         elif org_id:
             # Get datasets belonging to a specific organization
-            url = urljoin(self.source_url, "api/3/action/organization_show")
-            params = {"id": org_id, "include_datasets": True}
-            response = self.source_request(url, params=params)
+            org_response = self._show_organization(org_id)
             
-            if response.get("success", False):
-                org_data = response.get("result", {})
-                datasets = org_data.get("packages", [])
-                dataset_ids = [dataset.get("id") for dataset in datasets]
-                logger.info(f"Found {len(dataset_ids)} datasets in organization {org_id}")
-                return dataset_ids
-            else:
-                logger.error(f"Failed to get datasets for organization {org_id}: {response.get('error', {})}")
+            if not org_response.get("success", False):
+                logger.error(f"Failed to get datasets for organization {org_id}: {org_response.get('error', {})}")
                 return []
+            
+            owner_org = org_response.get("result", {}).get("id")
+            dataset_ids = self._search_dataset_ids(f"owner_org:{owner_org}")
+            
+            if dataset_ids is None:
+                logger.error(f"Failed to get datasets for organization {org_id}")
+                return []
+            
+            logger.info(f"Found {len(dataset_ids)} datasets in organization {org_id}")
+            return dataset_ids
         else:
             # Get all datasets
             url = urljoin(self.source_url, "api/3/action/package_list")
@@ -415,69 +906,177 @@ class CkanMigrator:
                 logger.error(f"Failed to get dataset list: {response.get('error', {})}")
                 return []
     
-    def download_package(self, package_id):
-        """Download a single package (dataset) and its resources"""
-        logger.info(f"Downloading dataset: {package_id}")
-        url = urljoin(self.source_url, "api/3/action/package_show")
-        params = {"id": package_id}
+    def get_datasets_for_orgs(self, org_ids, batch=100):
+        """Get IDs of the source datasets of several organizations, given by name or ID, with batched package_search calls"""
+        key = ("organizations", tuple(org_ids))
+        cached = self._dataset_list_cache.get(key)
+        if cached is not None:
+            return list(cached)
+        
+        dataset_ids = []
+        org_ids = list(dict.fromkeys(org_ids))
+        for start in range(0, len(org_ids), batch):
+            terms = " OR ".join(_solr_quote(org_id) for org_id in org_ids[start:start + batch])
+            
+            # CKAN appends "+state:(active)" to fq, so the OR must be one required clause
+            # or Solr treats both alternatives as optional and matches every dataset
+            datasets = self._search_datasets(self.source_url, self.source_request,
+                                             {"fq": f"+(organization:({terms}) OR owner_org:({terms}))"})
+            
+            if datasets is None:
+                logger.error("Failed to get datasets for the specified organizations")
+                return []
+            dataset_ids.extend(dataset.get("id") for dataset in datasets)
         
-        # Get package metadata
-        response = self.source_request(url, params=params)
+        # An org given by both name and ID lists its datasets twice
+        dataset_ids = list(dict.fromkeys(dataset_ids))
+        logger.info(f"Found {len(dataset_ids)} datasets in {len(org_ids)} specified organizations")
         
-        if not response.get("success", False):
-            logger.error(f"Failed to get package {package_id}: {response.get('error', {})}")
-            return None
+        if dataset_ids:
+            self._dataset_list_cache[key] = dataset_ids
+        return list(dataset_ids)
+    
+    def download_packages_bulk(self, package_ids, batch=100):
+        """Get full metadata of source datasets by name or ID with one package_search call per batch
+        
+        Returns the list of datasets found, or None if any batch failed.
+        """
+        datasets = []
+        for start in range(0, len(package_ids), batch):
+            batch_ids = package_ids[start:start + batch]
+            terms = " OR ".join(_solr_quote(package_id) for package_id in batch_ids)
+            
+            # Required clause, since CKAN appends "+state:(...)" to fq (see get_datasets_for_orgs)
+            params = {"fq": f"+(name:({terms}) OR id:({terms}))", "include_drafts": True}
+            
+            # Each name or ID matches at most one dataset, so more results mean the
+            # filter was ignored; fail rather than fetch the whole catalog
+            results = self._search_datasets(self.source_url, self.source_request, params,
+                                            rows=len(batch_ids), max_count=len(batch_ids))
+            
+            if results is None:
+                return None
+            datasets.extend(results)
         
-        package_data = response.get("result", {})
+        return datasets
+    
+    def _prefetch_packages(self, package_ids):
+        """Bulk-fetch metadata for datasets without saved metadata, keyed by both name and ID"""
+        if not self.force_refresh:
+            package_ids = [package_id for package_id in package_ids
+                           if not os.path.exists(os.path.join(self.datasets_dir, f"{package_id}.json"))]
+        
+        prefetched = {}
+        for dataset in self.download_packages_bulk(package_ids) or []:
+            prefetched[dataset.get("name")] = dataset
+            prefetched[dataset.get("id")] = dataset
+        
+        return prefetched
+    
+    def _search_datasets(self, base_url, request, params, rows=1000, max_count=None):
+        """Get all datasets on a CKAN instance matching package_search parameters using paged calls
+        
+        If more than max_count datasets match, the search is treated as failed (None).
+        """
+        url = urljoin(base_url, "api/3/action/package_search")
+        datasets = []
+        
+        while True:
+            # POST keeps long filter queries out of the URL
+            page_params = dict(params, rows=rows, start=len(datasets), include_private=True)
+            response = request(url, method="POST", data=page_params)
+            
+            if not response.get("success", False):
+                logger.error(f"Failed to search datasets: {response.get('error', {})}")
+                return None
+            
+            result = response.get("result", {})
+            if max_count is not None and result.get("count", 0) > max_count:
+                logger.error(f"Dataset search matched {result.get('count')} datasets, expected at most {max_count}")
+                return None
+            
+            results = result.get("results", [])
+            datasets.extend(results)
+            
+            # Sites may cap rows below what was asked (ckan.search.rows_max), so a short
+            # page is not necessarily the last one; page until count is reached instead
+            if not results or len(datasets) >= result.get("count", 0):
+                return datasets
+    
+    def _search_dataset_ids(self, fq):
+        """Get IDs of all source datasets matching a Solr filter query"""
+        datasets = self._search_datasets(self.source_url, self.source_request, {"fq": fq})
         
-        # Save package metadata
-        package_file = os.path.join(self.datasets_dir, f"{package_id}.json")
-        with open(package_file, 'w') as f:
-            json.dump(package_data, f, indent=2)
+        if datasets is None:
+            return None
+        return [dataset.get("id") for dataset in datasets]
+    
+    def download_package(self, package_id, package_metadata=None):
+        """Download a single package (dataset) and its resources
         
-        # Download resources if present
-        resources = package_data.get("resources", [])
-        resource_dir = os.path.join(self.datasets_dir, package_id)
+        package_metadata, if given, is the dataset's metadata already fetched in bulk
+        and is used instead of a package_show call.
+        """
+        package_data = self._get_package_metadata(package_id, package_metadata)
         
-        if resources and not os.path.exists(resource_dir):
-            os.makedirs(resource_dir)
+        if package_data is None:
+            return None
+        return self._download_resources(package_id, package_data)
+    
+    def _get_package_metadata(self, package_id, package_metadata=None):
+        """Get source dataset metadata from a saved file, the prefetched metadata or package_show"""
+        package_file = os.path.join(self.datasets_dir, f"{package_id}.json")
         
-        # Track resource file paths to add to metadata
-        resource_files = []
+        # Reuse metadata saved by an earlier run unless a refresh is forced
+        package_data = None
+        if not self.force_refresh:
+            package_data = self._load_cached_metadata(package_file)
         
-        for resource in resources:
-            resource_id = resource.get("id")
-            resource_url = resource.get("url")
-            resource_format = resource.get("format", "bin").lower()
+        if package_data is not None:
+            logger.debug("Using saved dataset metadata: %s", package_id)
+        elif package_metadata is not None:
+            logger.debug("Using prefetched dataset metadata: %s", package_id)
+            package_data = package_metadata
             
-            if not resource_url:
-                continue
+            # Save package metadata
+            with open(package_file, 'wb') as f:
+                f.write(_dumps(package_data, self.pretty_json))
+        else:
+            logger.debug("Downloading dataset: %s", package_id)
+            url = urljoin(self.source_url, "api/3/action/package_show")
+            params = {"id": package_id}
             
-            # Create filename for resource
-            resource_filename = f"{resource_id}.{resource_format}"
-            resource_path = os.path.join(resource_dir, resource_filename)
+            # Get package metadata
+            response = self.source_request(url, params=params)
             
-            logger.info(f"  Downloading resource: {resource_id}")
+            if not response.get("success", False):
+                logger.error(f"Failed to get package {package_id}: {response.get('error', {})}")
+                return None
             
-            try:
-                # Download resource file using the persistent session
-                headers = {"Authorization": self.source_api_key}
-                response = self.session.get(resource_url, headers=headers)
-                response.raise_for_status()
-                
-                with open(resource_path, 'wb') as f:
-                    f.write(response.content)
-                
-                # Add to resource files list
-                resource_files.append({
-                    "id": resource_id,
-                    "path": resource_path,
-                    "metadata": resource
-                })
-                
-                logger.info(f"  Resource saved to {resource_path}")
-            except requests.exceptions.RequestException as e:
-                logger.error(f"  Failed to download resource {resource_id}: {e}")
+            package_data = response.get("result", {})
+            
+            # Save package metadata
+            with open(package_file, 'wb') as f:
+                f.write(_dumps(package_data, self.pretty_json))
+        
+        return package_data
+    
+    def _download_resources(self, package_id, package_data):
+        """Download the resources of a dataset, returning the package data for upload"""
+        package_file = os.path.join(self.datasets_dir, f"{package_id}.json")
+        
+        # Download resources if present
+        resources = package_data.get("resources", [])
+        resource_dir = os.path.join(self.datasets_dir, package_id)
+        
+        if resources:
+            os.makedirs(resource_dir, exist_ok=True)
+        
+        # Download resources concurrently, at most resource_download_workers of this
+        # dataset at a time, tracking file paths to add to metadata
+        results = _map_bounded(self._download_executor, lambda resource: self._fetch_resource(resource, resource_dir),
+                               resources, self.resource_download_workers)
+        resource_files = [resource_file for resource_file in results if resource_file]
         
         return {
             "metadata": package_data,
@@ -485,6 +1084,59 @@ class CkanMigrator:
             "resources": resource_files
         }
 
+    def _fetch_resource(self, resource, resource_dir):
+        """Download a single resource file, returning its file entry or None"""
+        resource_id = resource.get("id")
+        resource_url = resource.get("url")
+        resource_format = resource.get("format", "bin").lower()
+        
+        if not resource_url:
+            return None
+        
+        # Create filename for resource
+        resource_filename = f"{resource_id}.{resource_format}"
+        resource_path = os.path.join(resource_dir, resource_filename)
+        resource_file = {
+            "id": resource_id,
+            "path": resource_path,
+            "metadata": resource
+        }
+        
+        # Reuse a file downloaded by an earlier run unless a refresh is forced
+        if not self.force_refresh and os.path.exists(resource_path):
+            logger.debug("  Using saved resource: %s", resource_path)
+            return resource_file
+        
+        logger.debug("  Downloading resource: %s", resource_id)
+        
+        # Download to a partial file first so an interrupted download is never reused
+        partial_path = resource_path + ".part"
+        
+        try:
+            # Stream resource file to disk using the persistent session
+            with self.source_session.get(resource_url, stream=True, timeout=(10, 300)) as response:
+                response.raise_for_status()
+                
+                # Decode gzip/deflate transfer encoding while copying chunks
+                response.raw.decode_content = True
+                with open(partial_path, 'wb') as f:
+                    shutil.copyfileobj(response.raw, f, length=1 << 20)
+            
+            os.replace(partial_path, resource_path)
+            logger.debug("  Resource saved to %s", resource_path)
+            
+            return resource_file
+        except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError, OSError) as e:
+            # Reading response.raw directly raises urllib3 errors, not requests ones
+            logger.error(f"  Failed to download resource {resource_id}: {e}")
+            
+            # Don't leave the partial file behind
+            try:
+                os.remove(partial_path)
+            except OSError:
+                pass
+            return None
+
     def migrate_package(self, package_data, skip_resources=False):
         """Migrate a package (dataset) and its resources to target CKAN using package_create"""
         if not package_data:
@@ -495,58 +1147,46 @@ class CkanMigrator:
         package_id = metadata.get("id")
         package_name = metadata.get("name", "")
         
-        logger.info(f"Migrating dataset: {package_name}")
+        logger.debug("Migrating dataset: %s", package_name)
         
-        # Sanitize dataset data
-        sanitized_metadata = metadata.copy()
+        # Sanitize dataset data for package_create: drop IDs to force creation of new objects,
+        # resources (uploaded separately) and other fields that shouldn't be included
+        sanitized_metadata = {key: value for key, value in metadata.items() if key not in _PACKAGE_DROP}
         
         # Sanitize the dataset name
         original_name = sanitized_metadata.get('name', '')
         sanitized_name = self.sanitize_name(original_name)
         
         if original_name != sanitized_name:
-            logger.info(f"Dataset name sanitized: '{original_name}' -> '{sanitized_name}'")
+            logger.debug("Dataset name sanitized: '%s' -> '%s'", original_name, sanitized_name)
             sanitized_metadata['name'] = sanitized_name
         
-        # For CKAN 2.11.2, we'll use package_create 
-        # We'll remove all IDs to force creation of new objects
-        if 'id' in sanitized_metadata:
-            del sanitized_metadata['id']
-            
-        # Remove resource data as we'll upload resources separately
-        if 'resources' in sanitized_metadata:
-            del sanitized_metadata['resources']
-            
-        # Remove fields that shouldn't be included
-        fields_to_remove = [
-            "metadata_created", "metadata_modified", "revision_id", "revision_timestamp",
-            "creator_user_id", "private"
-        ]
-        
-        for field in fields_to_remove:
-            if field in sanitized_metadata:
-                del sanitized_metadata[field]
-        
         # Update organization reference using the ID mapping
         if "owner_org" in sanitized_metadata:
             source_org_id = sanitized_metadata["owner_org"]
-            if source_org_id in self.org_id_mapping:
-                sanitized_metadata["owner_org"] = self.org_id_mapping[source_org_id]
+            target_org_id = self._wait_for_org_mapping(source_org_id)
+            if target_org_id:
+                sanitized_metadata["owner_org"] = target_org_id
             else:
                 logger.warning(f"Organization {source_org_id} not found in mapping, removing owner_org")
                 del sanitized_metadata["owner_org"]
         
-        # Check if dataset already exists
-        check_url = urljoin(self.target_url, "api/3/action/package_show")
-        check_params = {"id": sanitized_name}
-        check_response = self.target_request(check_url, params=check_params)
+        # Check if dataset already exists, using the target index when it has been loaded
+        if self._target_pkg_names is not None:
+            existing_pkg_id = self._target_pkg_names.get(sanitized_name)
+        else:
+            check_url = urljoin(self.target_url, "api/3/action/package_show")
+            check_params = {"id": sanitized_name}
+            check_response = self.target_request(check_url, params=check_params)
+            
+            existing_pkg_id = None
+            if check_response.get("success", False):
+                existing_pkg_id = check_response.get("result", {}).get("id")
         
-        if check_response.get("success", False):
+        if existing_pkg_id:
             # Dataset already exists, we'll skip it
-            existing_pkg = check_response.get("result", {})
-            existing_pkg_id = existing_pkg.get("id")
-            logger.info(f"Dataset already exists with ID: {existing_pkg_id}")
-            logger.info(f"Skipping dataset creation, moving to resources")
+            logger.debug("Dataset already exists with ID: %s", existing_pkg_id)
+            logger.debug("Skipping dataset creation, moving to resources")
             target_package_id = existing_pkg_id
         else:
             # Create dataset in target CKAN
@@ -560,23 +1200,41 @@ class CkanMigrator:
             created_package = create_response.get("result", {})
             target_package_id = created_package.get("id")
             
-            logger.info(f"Created dataset with ID: {target_package_id}")
+            logger.debug("Created dataset with ID: %s", target_package_id)
+            
+            if self._target_pkg_names is not None:
+                self._target_pkg_names[sanitized_name] = target_package_id
         
-        # Upload resources if not skipping
+        # Upload resources concurrently if not skipping, at most resource_upload_workers
+        # of this dataset at a time. CKAN 2.11 locks the dataset row in resource_create
+        # (package_show for_update), so concurrent creates on one dataset don't lose resources
         if not skip_resources and resources:
-            successful_resources = 0
-            for resource_data in resources:
-                if self.migrate_resource(target_package_id, resource_data):
-                    successful_resources += 1
+            results = _map_bounded(self._upload_executor,
+                                   lambda resource_data: self.migrate_resource(target_package_id, resource_data),
+                                   resources, self.resource_upload_workers)
+            created_resource_ids = [resource_id for resource_id in results if resource_id]
             
-            logger.info(f"Uploaded {successful_resources}/{len(resources)} resources")
+            logger.debug("Uploaded %d/%d resources", len(created_resource_ids), len(resources))
+            
+            # Concurrent uploads finish in any order, so restore the source order on new datasets
+            if not existing_pkg_id and len(created_resource_ids) > 1:
+                self.reorder_resources(target_package_id, created_resource_ids)
         
         return True
     
+    def reorder_resources(self, package_id, resource_ids):
+        """Set the order of resources in a target dataset"""
+        url = urljoin(self.target_url, "api/3/action/package_resource_reorder")
+        data = {"id": package_id, "order": resource_ids}
+        response = self.target_request(url, method="POST", data=data)
+        
+        if not response.get("success", False):
+            logger.warning(f"Failed to reorder resources of dataset {package_id}: {response.get('error', {})}")
+    
     def migrate_resource(self, package_id, resource_data):
-        """Migrate a resource to the target CKAN"""
+        """Migrate a resource to the target CKAN, returning the created resource ID, or None on failure"""
         if not resource_data:
-            return False
+            return None
         
         resource_id = resource_data.get("id")
         resource_path = resource_data.get("path")
@@ -584,59 +1242,42 @@ class CkanMigrator:
         
         if not os.path.exists(resource_path):
             logger.error(f"  Resource file not found: {resource_path}")
-            return False
-        
-        logger.info(f"  Uploading resource: {resource_id}")
-        
-        # Sanitize resource metadata
-        sanitized_metadata = resource_metadata.copy()
+            return None
         
-        # Remove fields that shouldn't be included 
-        fields_to_remove = [
-            "id", "created", "last_modified", "revision_id", "resource_type",
-            "position", "cache_url", "cache_last_updated", "webstore_url", 
-            "webstore_last_updated", "datastore_active"
-        ]
+        logger.debug("  Uploading resource: %s", resource_id)
         
-        for field in fields_to_remove:
-            if field in sanitized_metadata:
-                del sanitized_metadata[field]
+        # Convert metadata to form fields in one pass, dropping fields that shouldn't be included
+        data = {key: str(value) if value is not None else ''
+                for key, value in resource_metadata.items() if key not in _RESOURCE_DROP}
         
         # Add package_id to resource metadata
-        sanitized_metadata["package_id"] = package_id
+        data["package_id"] = package_id
+        
+        # Some important resource fields need to be properly sanitized
+        if 'name' in data:
+            data['name'] = data['name'][:100]
         
         # Create resource
         url = urljoin(self.target_url, "api/3/action/resource_create")
         
-        # Some important resource fields need to be properly sanitized
-        if 'name' in sanitized_metadata:
-            sanitized_metadata['name'] = sanitized_metadata['name'][:100]
-        
-        if 'description' in sanitized_metadata and sanitized_metadata['description'] is None:
-            sanitized_metadata['description'] = ''
-        
-        # Prepare the file for upload
-        files = {
-            'upload': (os.path.basename(resource_path), open(resource_path, 'rb'))
-        }
+        # Prepare the file for upload, hinting a sequential read so readahead grows
+        upload_file = open(resource_path, 'rb')
+        _fadvise(upload_file, 'POSIX_FADV_SEQUENTIAL')
         
         try:
-            # Convert metadata to form fields
-            data = {key: str(value) if value is not None else '' 
-                   for key, value in sanitized_metadata.items()}
-            
-            # CKAN 2.11.2 expects a simple HTTP POST form, not JSON
-            headers = {"Authorization": self.target_api_key}
+            # CKAN 2.11.2 expects a simple HTTP POST form, not JSON; the file is
+            # streamed from disk rather than read into memory
+            body = _MultipartFile(data, 'upload', os.path.basename(resource_path), upload_file)
             
-            # Make the request using the persistent session
-            response = self.session.post(url, headers=headers, data=data, files=files)
+            # Make the request using the persistent target session
+            response = self.target_session.post(url, data=body, headers={"Content-Type": body.content_type})
             
             if response.status_code == 200:
                 try:
-                    response_data = response.json()
+                    response_data = _loads(response.content)
                     if response_data.get("success", False):
-                        logger.info(f"  Resource uploaded successfully")
-                        return True
+                        logger.debug("  Resource uploaded successfully: %s", resource_id)
+                        return response_data.get("result", {}).get("id")
                     else:
                         error_msg = response_data.get('error', {})
                         logger.error(f"  Failed to upload resource: {error_msg}")
@@ -657,20 +1298,247 @@ class CkanMigrator:
                     }
                     
                     alt_url = urljoin(self.target_url, "api/3/action/resource_create")
-                    alt_response = self.session.post(alt_url, headers=headers, json=minimal_data)
+                    alt_response = self.target_session.post(alt_url, **_json_body(minimal_data))
                     
-                    if alt_response.status_code == 200 and alt_response.json().get("success", False):
-                        logger.info("  Successfully created resource placeholder")
-                        return True
+                    if alt_response.status_code == 200:
+                        alt_data = _loads(alt_response.content)
+                        if alt_data.get("success", False):
+                            logger.debug("  Successfully created resource placeholder")
+                            return alt_data.get("result", {}).get("id")
             
-            return False
+            return None
                     
         except Exception as e:
             logger.error(f"  Error uploading resource: {e}")
+            return None
+        finally:
+            # The file is not read again, so drop its pages from the page cache and close it
+            _fadvise(upload_file, 'POSIX_FADV_DONTNEED')
+            upload_file.close()
+    
+    def _process_organization(self, org_id, index, total_orgs):
+        """Download and upload a single organization, returning True on success"""
+        self.rate_limiter.acquire()
+        logger.debug("Processing organization %d/%d: %s", index + 1, total_orgs, org_id)
+        
+        try:
+            # Download organization
+            org_data = self.download_organization(org_id)
+            
+            if org_data:
+                # Upload organization
+                return self.upload_organization(org_data)
+        except Exception as e:
+            logger.error(f"Error processing organization {org_id}: {e}")
+            logger.info("Continuing with next organization...")
+        
+        return False
+    
+    def _download_dataset(self, package_id, index, total_packages, package_metadata=None, with_resources=True):
+        """Download a single dataset, returning its package data or None"""
+        self.rate_limiter.acquire()
+        logger.debug("Processing dataset %d/%d: %s", index + 1, total_packages, package_id)
+        
+        try:
+            package_data = self._get_package_metadata(package_id, package_metadata)
+            
+            if package_data is None:
+                return None
+            
+            if self._already_migrated(package_data, with_resources):
+                logger.debug("Dataset already migrated, skipping: %s", package_data.get('name'))
+                self.skipped_datasets.append(package_id)
+                return None
+            
+            return self._download_resources(package_id, package_data)
+        except Exception as e:
+            logger.error(f"Error processing dataset {package_id}: {e}")
+            logger.info("Continuing with next dataset...")
+            return None
+    
+    def _already_migrated(self, package_metadata, with_resources=True):
+        """Check whether the target has a dataset of this name with at least as many resources"""
+        if self.force or self._target_pkg_resources is None:
+            return False
+        
+        name = self.sanitize_name(package_metadata.get("name", ""))
+        if name not in self._target_pkg_resources:
             return False
+        
+        return not with_resources or self._target_pkg_resources[name] >= len(package_metadata.get("resources", []))
+    
+    def _upload_dataset(self, package_data, skip_resources=False):
+        """Upload a single downloaded dataset, returning True on success"""
+        try:
+            # Using package_create instead of package_update
+            return self.migrate_package(package_data, skip_resources=skip_resources)
+        except Exception as e:
+            logger.error(f"Error processing dataset {package_data['metadata'].get('id')}: {e}")
+            logger.info("Continuing with next dataset...")
+            return False
+    
+    def _run_pipeline(self, items, download, upload, workers=1, prefetch=None, batch_size=1):
+        """Download items on worker threads while already downloaded items are uploaded on others
+        
+        Download threads take up to batch_size items at a time, fewer when there are not
+        enough items to keep every thread busy. If prefetch is given, prefetch(batch)
+        returns a dict of data fetched for the whole batch at once, and download(index, item,
+        prefetched) receives the entry for its item (or None). download returns the downloaded
+        data or None, and upload(data) returns True on success. Each stage runs on its own set
+        of workers threads, and at most pipeline_queue_size downloaded items wait for upload.
+        Returns the number of successful uploads.
+        """
+        downloaded = queue.Queue(maxsize=self.pipeline_queue_size)
+        
+        # Split small runs evenly so batching never leaves download threads idle
+        batch_size = max(1, min(batch_size, -(-len(items) // workers)))
+        pending = enumerate(items)
+        pending_lock = threading.Lock()
+        
+        # Set when any thread fails or the run is interrupted, so no new items are started
+        stop = threading.Event()
+        
+        def produce():
+            try:
+                while not stop.is_set():
+                    with pending_lock:
+                        batch = list(itertools.islice(pending, batch_size))
+                    if not batch:
+                        return
+                    
+                    prefetched = prefetch([item for _, item in batch]) if prefetch else {}
+                    for index, item in batch:
+                        if stop.is_set():
+                            return
+                        data = download(index, item, prefetched.get(item))
+                        if data:
+                            downloaded.put(data)
+            except BaseException:
+                stop.set()
+                raise
+        
+        def consume():
+            successful = 0
+            error = None
+            while True:
+                data = downloaded.get()
+                if data is None:
+                    if error is not None:
+                        raise error
+                    return successful
+                
+                # After a failure keep draining the queue so producers never block on it
+                if error is not None:
+                    continue
+                
+                try:
+                    if upload(data):
+                        successful += 1
+                except BaseException as e:
+                    error = e
+                    stop.set()
+        
+        with ThreadPoolExecutor(max_workers=2 * workers) as executor:
+            producers = [executor.submit(produce) for _ in range(workers)]
+            consumers = [executor.submit(consume) for _ in range(workers)]
+            
+            try:
+                wait(producers)
+            finally:
+                # Stop the remaining producers if the run was interrupted, and signal
+                # the consumers only once every producer has finished queueing items
+                stop.set()
+                wait(producers)
+                for _ in consumers:
+                    downloaded.put(None)
+            
+            successful = sum(consumer.result() for consumer in consumers)
+            for producer in producers:
+                producer.result()
+            return successful
+    
+    def collect_dataset_ids(self, specific_orgs=None, specific_datasets=None):
+        """Get the IDs of the datasets to migrate
+        
+        Results are cached, so calling this early (e.g. while waiting for confirmation)
+        lets migrate_all reuse the listing.
+        """
+        if specific_datasets:
+            return self.get_dataset_list(specific_datasets=specific_datasets)
+        
+        if specific_orgs:
+            # Get datasets for specific organizations
+            return self.get_datasets_for_orgs(specific_orgs)
+        
+        # Get all datasets
+        return self.get_dataset_list()
+    
+    def _migrate_organizations(self, org_ids):
+        """Migrate organizations concurrently, returning the number migrated successfully"""
+        successful_org_migrations = 0
+        total_orgs = len(org_ids)
+        progress = ProgressReporter("Organizations", total_orgs)
+        
+        # Process organizations concurrently
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = [
+                    executor.submit(self._process_organization, org_id, i, total_orgs)
+                    for i, org_id in enumerate(org_ids)
+                ]
+                for future in as_completed(futures):
+                    if future.result():
+                        successful_org_migrations += 1
+                    progress.update()
         finally:
-            # Close the file
-            files['upload'][1].close()
+            # Always persist the mapping, even if the run is interrupted
+            self.save_org_mapping()
+            
+            # Datasets whose owner org was not mapped no longer need to wait
+            with self._mapping_changed:
+                self._orgs_done = True
+                self._mapping_changed.notify_all()
+        
+        logger.info(f"\nOrganization migration complete. Successfully migrated {successful_org_migrations}/{total_orgs} organizations.")
+        return successful_org_migrations
+    
+    def _migrate_datasets(self, package_ids, migrate_resources=True):
+        """Download and upload datasets, returning the number migrated successfully"""
+        total_packages = len(package_ids)
+        progress = ProgressReporter("Datasets", total_packages)
+        self.skipped_datasets = []
+        
+        def download(index, package_id, package_metadata):
+            package_data = self._download_dataset(package_id, index, total_packages, package_metadata,
+                                                  with_resources=migrate_resources)
+            # Datasets that failed or were skipped never reach the upload stage
+            if not package_data:
+                progress.update()
+            return package_data
+        
+        def upload(package_data):
+            try:
+                return self._upload_dataset(package_data, skip_resources=not migrate_resources)
+            finally:
+                progress.update()
+        
+        # Download and upload datasets concurrently, overlapping the two stages;
+        # metadata is fetched with one package_search call per batch of datasets
+        successful_dataset_migrations = self._run_pipeline(
+            package_ids,
+            download,
+            upload,
+            workers=self.max_workers,
+            prefetch=self._prefetch_packages,
+            batch_size=self.package_batch_size
+        )
+        
+        logger.info(f"\nDataset migration complete. Successfully migrated {successful_dataset_migrations}, "
+                    f"{len(self.skipped_datasets)} already on target, of {total_packages} datasets.")
+        if self.skipped_datasets:
+            logger.info("Datasets already on target were skipped (use --force to migrate them again)")
+        
+        return successful_dataset_migrations
     
     def migrate_all(self, migrate_orgs=True, migrate_datasets=True, migrate_resources=True, 
                    specific_orgs=None, specific_datasets=None):
@@ -680,93 +1548,51 @@ class CkanMigrator:
             logger.error("Target database preparation failed. Please resolve issues before proceeding.")
             return
         
+        # Look up existing target organizations and datasets once instead of once per item
+        self._prime_target_indexes(load_orgs=migrate_orgs, load_datasets=migrate_datasets)
+        
         # Initialize counters
         successful_org_migrations = 0
         successful_dataset_migrations = 0
         org_ids = []
         package_ids = []
         
-        # Migrate organizations if requested
-        if migrate_orgs:
-            logger.info("\n===== MIGRATING ORGANIZATIONS =====\n")
-            org_ids = self.get_organization_list(specific_orgs=specific_orgs)
-            
-            if not org_ids:
-                logger.warning("No organizations found to migrate.")
-            else:
-                total_orgs = len(org_ids)
-                
-                # Process each organization
-                for i, org_id in enumerate(org_ids):
-                    logger.info(f"\nProcessing organization {i+1}/{total_orgs}: {org_id}")
-                    
-                    try:
-                        # Download organization
-                        org_data = self.download_organization(org_id)
-                        
-                        if org_data:
-                            # Upload organization
-                            if self.upload_organization(org_data):
-                                successful_org_migrations += 1
-                    except Exception as e:
-                        logger.error(f"Error processing organization {org_id}: {e}")
-                        logger.info("Continuing with next organization...")
-                    
-                    # Add a small delay to prevent overwhelming the server
-                    time.sleep(1)
+        with ThreadPoolExecutor(max_workers=1) as phase_executor:
+            # Migrate organizations if requested, in the background so datasets can
+            # start migrating as soon as their owner organization has been mapped
+            org_phase = None
+            if migrate_orgs:
+                logger.info("\n===== MIGRATING ORGANIZATIONS =====\n")
+                org_ids = self.get_organization_list(specific_orgs=specific_orgs)
                 
-                logger.info(f"\nOrganization migration complete. Successfully migrated {successful_org_migrations}/{total_orgs} organizations.")
-        
-        # Migrate datasets if requested
-        if migrate_datasets:
-            logger.info("\n===== MIGRATING DATASETS =====\n")
-            
-            # Get list of datasets to migrate
-            if specific_datasets:
-                package_ids = self.get_dataset_list(specific_datasets=specific_datasets)
-            elif specific_orgs:
-                # Get datasets for specific organizations
-                package_ids = []
-                for org_id in specific_orgs:
-                    org_datasets = self.get_dataset_list(org_id=org_id)
-                    package_ids.extend(org_datasets)
-            else:
-                # Get all datasets
-                package_ids = self.get_dataset_list()
-            
-            if not package_ids:
-                logger.warning("No datasets found to migrate.")
-                return
-            
-            total_packages = len(package_ids)
+                if not org_ids:
+                    logger.warning("No organizations found to migrate.")
+                else:
+                    self._orgs_done = False
+                    org_phase = phase_executor.submit(self._migrate_organizations, org_ids)
             
-            # Process each package
-            for i, package_id in enumerate(package_ids):
-                logger.info(f"\nProcessing dataset {i+1}/{total_packages}: {package_id}")
+            # Migrate datasets if requested
+            if migrate_datasets:
+                logger.info("\n===== MIGRATING DATASETS =====\n")
                 
-                try:
-                    # Download package
-                    package_data = self.download_package(package_id)
-                    
-                    if package_data:
-                        # Using package_create instead of package_update
-                        if self.migrate_package(package_data, skip_resources=not migrate_resources):
-                            successful_dataset_migrations += 1
-                except Exception as e:
-                    logger.error(f"Error processing dataset {package_id}: {e}")
-                    logger.info("Continuing with next dataset...")
+                # Get list of datasets to migrate
+                package_ids = self.collect_dataset_ids(specific_orgs, specific_datasets)
                 
-                # Add a small delay to prevent overwhelming the server
-                time.sleep(1)
+                if not package_ids:
+                    logger.warning("No datasets found to migrate.")
+                else:
+                    successful_dataset_migrations = self._migrate_datasets(package_ids, migrate_resources)
             
-            logger.info(f"\nDataset migration complete. Successfully migrated {successful_dataset_migrations}/{total_packages} datasets.")
+            if org_phase is not None:
+                successful_org_migrations = org_phase.result()
         
         # Display summary
         logger.info("\n===== MIGRATION SUMMARY =====")
         if migrate_orgs and org_ids:
             logger.info(f"Organizations: {successful_org_migrations}/{len(org_ids)} migrated successfully")
         if migrate_datasets and package_ids:
-            logger.info(f"Datasets: {successful_dataset_migrations}/{len(package_ids)} migrated successfully")
+            logger.info(f"Datasets: {successful_dataset_migrations} migrated successfully, "
+                        f"{len(self.skipped_datasets)} already on target, of {len(package_ids)}")
         
         logger.info("\n===== POST-MIGRATION STEPS =====")
         logger.info("1. Run 'ckan -c /etc/ckan/default/ckan.ini search-index rebuild' on the target system")
@@ -774,11 +1600,20 @@ class CkanMigrator:
         logger.info("3. Verify permissions and user roles")
 
 
+@functools.lru_cache(maxsize=8)
+def _read_config(config_file, mtime_ns, size):
+    """Parse a configuration file; cached by path, modification time and size"""
+    with open(config_file, 'rb') as f:
+        return _loads(f.read())
+
+
 def load_config(config_file):
-    """Load configuration from a JSON file"""
+    """Load configuration from a JSON file, reusing the parsed file while it is unchanged"""
     try:
-        with open(config_file, 'r') as f:
-            config = json.load(f)
+        stat = os.stat(config_file)
+        
+        # Copy so callers can't modify the cached configuration
+        config = dict(_read_config(os.path.abspath(config_file), stat.st_mtime_ns, stat.st_size))
         
         required_keys = ["source_url", "source_api_key", "target_url", "target_api_key"]
         missing_keys = [key for key in required_keys if key not in config]
@@ -793,6 +1628,38 @@ def load_config(config_file):
         return None
 
 
+def _format_plan(config, components, specific_orgs=None, specific_datasets=None):
+    """Build the migration plan banner shown before migrating"""
+    lines = [
+        "\n===== CKAN MIGRATION (2.8.2 -> 2.11.2) =====\n",
+        f"Source CKAN: {config['source_url']}",
+        f"Target CKAN: {config['target_url']}",
+        f"\nComponents to migrate: {', '.join(components)}",
+        "SSL verification: DISABLED"
+    ]
+    
+    if specific_orgs:
+        lines.append(f"Filtering to specified organizations: {specific_orgs}")
+    
+    if specific_datasets:
+        lines.append(f"Filtering to specified datasets: {specific_datasets}")
+    
+    lines.append("\nWARNING: This process may take a long time depending on the amount of data")
+    return "\n".join(lines)
+
+
+def _positive_int(value):
+    """argparse type for integer options that must be at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def parse_args():
     """Parse command line arguments"""
     parser = argparse.ArgumentParser(description='CKAN Migration Tool (2.8.2 -> 2.11.2)')
@@ -815,6 +1682,25 @@ def parse_args():
     parser.add_argument('--datasets', nargs='+',
                         help='Specific datasets to migrate (by name or ID)')
     
+    parser.add_argument('--workers', type=_positive_int, default=8,
+                        help='Number of organizations/datasets to process concurrently (default: 8)')
+    
+    parser.add_argument('--rate', type=float, default=10.0,
+                        help='Maximum organizations/datasets started per second, reduced automatically '
+                             'when a server answers 429/503 (default: 10, 0 for no limit)')
+    
+    parser.add_argument('--force-refresh', action='store_true',
+                        help='Download metadata and resource files again even if saved by an earlier run')
+    
+    parser.add_argument('--force', action='store_true',
+                        help='Migrate datasets again even if the target already has them with all their resources')
+    
+    parser.add_argument('--pretty', action='store_true',
+                        help='Write indented metadata JSON files (for debugging)')
+    
+    parser.add_argument('--verbose', '-v', action='store_true',
+                        help='Also log per-resource download and upload progress')
+    
     parser.add_argument('--yes', '-y', action='store_true',
                         help='Skip confirmation prompt')
     
@@ -825,6 +1711,9 @@ if __name__ == "__main__":
     # Parse command line arguments
     args = parse_args()
     
+    if args.verbose:
+        logger.setLevel(logging.DEBUG)
+    
     # Load configuration from file
     config = load_config(args.config)
     
@@ -854,34 +1743,45 @@ if __name__ == "__main__":
         components.append("resources")
     
     # Display migration plan
-    logger.info("\n===== CKAN MIGRATION (2.8.2 -> 2.11.2) =====\n")
-    logger.info(f"Source CKAN: {config['source_url']}")
-    logger.info(f"Target CKAN: {config['target_url']}")
-    logger.info(f"\nComponents to migrate: {', '.join(components)}")
-    logger.info("SSL verification: DISABLED")
-    
-    if args.orgs:
-        logger.info(f"Filtering to specified organizations: {args.orgs}")
-    
-    if args.datasets:
-        logger.info(f"Filtering to specified datasets: {args.datasets}")
-    
-    logger.info("\nWARNING: This process may take a long time depending on the amount of data")
-    
-    # Ask for confirmation unless --yes flag is provided
-    if not args.yes:
-        proceed = input("\nDo you want to proceed? (y/n): ")
-        if proceed.lower() != 'y':
-            logger.info("Migration aborted.")
-            sys.exit(0)
+    logger.info(_format_plan(config, components, args.orgs, args.datasets))
     
     # Initialize and run the migrator using context manager
     with CkanMigrator(
         config['source_url'],
         config['source_api_key'],
         config['target_url'],
-        config['target_api_key']
+        config['target_api_key'],
+        max_workers=args.workers,
+        pretty_json=args.pretty,
+        force_refresh=args.force_refresh,
+        rate_limit=args.rate,
+        force=args.force
     ) as migrator:
+        # Ask for confirmation unless --yes flag is provided
+        if not args.yes:
+            # List the datasets to migrate in the background while waiting for the answer,
+            # holding back its log messages so they don't land on the prompt line
+            prefetch = None
+            prefetch_logs = _HeldThreadLogs("dataset-prefetch")
+            if migrate_datasets:
+                logger.addFilter(prefetch_logs)
+                prefetch = threading.Thread(target=migrator.collect_dataset_ids, name="dataset-prefetch",
+                                            args=(args.orgs, args.datasets), daemon=True)
+                prefetch.start()
+            
+            # Let the plan above reach the console before prompting
+            _log_queue.join()
+            proceed = input("\nDo you want to proceed? (y/n): ")
+            if proceed.lower() != 'y':
+                logger.info("Migration aborted.")
+                sys.exit(0)
+            
+            # Wait for the listing so migrate_all finds it in the cache
+            if prefetch is not None:
+                prefetch_logs.release()
+                prefetch.join()
+                logger.removeFilter(prefetch_logs)
+        
         migrator.migrate_all(
             migrate_orgs=migrate_orgs,
             migrate_datasets=migrate_datasets,